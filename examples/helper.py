@@ -1,5 +1,6 @@
 from typing import Union
 
+import numpy as np
 import pandas as pd
 
 
@@ -33,12 +34,13 @@ def groupby_consecutive(
 
     assert col_name in df.columns
 
-    df_cum = (
-        (df[col_name].diff(1) != 0)
-        .astype("int")
-        .cumsum()
-        .rename("value_grp")
-        .to_frame()
+    # A new value group starts wherever the value differs from its predecessor
+    values = df[col_name].to_numpy()
+    changed = np.empty(len(values), dtype=bool)
+    changed[:1] = True
+    np.not_equal(values[1:], values[:-1], out=changed[1:])
+    df_cum = pd.DataFrame(
+        {"value_grp": np.cumsum(changed, dtype=np.int32)}, index=df.index
     )
     df_cum["sequence_idx"] = df.index
     df_cum[col_name] = df[col_name]
@@ -1,17 +1,28 @@
 """Fixtures and helper functions for testing"""
 
 
+import glob
 import os
-from typing import Union
+import pickle
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, List, Tuple, Union
 
 import numpy as np
 import pandas as pd
+import plotly
 import plotly.graph_objects as go
+import pyarrow
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 import pytest
 from plotly.subplots import make_subplots
 
+import plotly_resampler
 from plotly_resampler import (
-    LTTB,
+    EfficientLTTB,
     EveryNthPoint,
     FigureResampler,
     unregister_plotly_resampler,
@@ -22,6 +33,174 @@ _nb_samples = 10_000
 data_dir = "examples/data/"
 headless = True
 TESTING_LOCAL = False  # SET THIS TO TRUE IF YOU ARE TESTING LOCALLY
+_pr_src_dir = os.path.dirname(plotly_resampler.__file__)
+
+
+@lru_cache(maxsize=None)
+def _load_parquet(file_name: str) -> pd.DataFrame:
+    # Parsed once per session; callers must not mutate the returned DataFrame
+    return pd.read_parquet(f"{data_dir}{file_name}", engine="pyarrow")
+
+
+@lru_cache(maxsize=None)
+def _load_swimming_pool(last: str = "4D") -> pd.Series:
+    """Load the non-NaN swimming pool occupancy of the `last` time period.
+
+    Equivalent to ``df_gusb["zwembad"].last(last).dropna()``, but both the time-range
+    and the NaN filter are pushed down into the parquet reader.
+    """
+    path = f"{data_dir}df_gusb.parquet"
+    # The end timestamp is read from the row-group statistics in the file footer
+    metadata = pq.ParquetFile(path).metadata
+    ts_idx = metadata.schema.to_arrow_schema().get_field_index("timestamp")
+    t_end = max(
+        metadata.row_group(i).column(ts_idx).statistics.max
+        for i in range(metadata.num_row_groups)
+    )
+    t_start = pd.Timestamp(t_end) - pd.Timedelta(last)
+
+    dataset = ds.dataset(path, format="parquet")
+    table = dataset.to_table(
+        columns=["timestamp", "zwembad"],
+        filter=(ds.field("timestamp") > t_start.to_pydatetime())
+        & ds.field("zwembad").is_valid(),
+    )
+    return table.to_pandas()["zwembad"]
+
+
+def _load_example_data() -> Tuple[pd.Series, pd.DataFrame]:
+    """Load the swimming pool and power consumption data of the example figures.
+
+    Both parquet files are read concurrently, overlapping their IO and decoding.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pool_future = executor.submit(_load_swimming_pool, last="4D")
+        pc_future = executor.submit(_load_parquet, "df_pc_test.parquet")
+        return pool_future.result(), pc_future.result()
+
+
+def _mean_last_hour_hovertext(s: pd.Series) -> np.ndarray:
+    """Return the "mean last hour: <value>" hovertext for each sample of `s`.
+
+    The (integer) rolling mean only takes a handful of distinct values, so the text is
+    formatted once per distinct value and then gathered for all samples.
+    """
+    rolling_mean = s.rolling("1h").mean().to_numpy().astype(np.uint16)
+    values, inverse = np.unique(rolling_mean, return_inverse=True)
+    return np.array([f"mean last hour: {v}" for v in values.tolist()])[inverse]
+
+
+@lru_cache(maxsize=None)
+def _noisy_sine(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the (read-only) index and float64 noisy sine values of `float_series`.
+
+    The noise is seeded, so the arrays are only generated once per session.
+    """
+    x = np.arange(n, dtype=np.uint32)
+    # Compute the noisy sine in-place in a single float64 buffer
+    y = np.empty(n, dtype=np.float64)
+    np.divide(x, 50, out=y)
+    np.sin(y, out=y)
+    noise = np.random.default_rng(seed=0).standard_normal(n)
+    noise /= 5
+    y += noise
+    x.flags.writeable = y.flags.writeable = False
+    return x, y
+
+
+@lru_cache(maxsize=None)
+def _rising_noisy_sine(n: int) -> np.ndarray:
+    """Return the (read-only) float32 "Generated sine" data of the example figures."""
+    x = np.arange(n)
+    # (3 + sin(x / 200_000) + noise / 10) * x / 100_000, computed in-place
+    y = np.sin(x / 200_000)
+    y += 3
+    noise = np.random.default_rng(seed=0).standard_normal(n)
+    noise /= 10
+    y += noise
+    y *= x
+    y /= 100_000
+    y = y.astype(np.float32)
+    y.flags.writeable = False
+    return y
+
+
+def _last(df: pd.DataFrame, period: str) -> pd.DataFrame:
+    """Select the final `period` of a sorted, time-indexed `df`.
+
+    Same selection as the (deprecated) ``df.last(period)``, but the cutoff is located
+    with a binary search on the index.
+    """
+    t_start = df.index[-1] - pd.Timedelta(period)
+    return df.iloc[df.index.searchsorted(t_start, side="right") :]
+
+
+def _run_length_bounds(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the start and (inclusive) end positions of each run of equal values."""
+    if len(values) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    # A run ends wherever the next value differs, and the next run starts right after
+    changes = np.flatnonzero(values[1:] != values[:-1])
+    starts = np.empty(len(changes) + 1, dtype=np.int64)
+    starts[0] = 0
+    np.add(changes, 1, out=starts[1:])
+    ends = np.empty_like(starts)
+    ends[:-1] = changes
+    ends[-1] = len(values) - 1
+    return starts, ends
+
+
+def _cached_figure(
+    config,
+    name: str,
+    build_fig: Callable[[], FigureResampler],
+    input_paths: List[str],
+) -> FigureResampler:
+    """Return ``build_fig()``, persisted as a pickle in the pytest cache directory.
+
+    The pickle is keyed on the Python and (figure-building) dependency versions, and is
+    reused over pytest runs as long as it is newer than the `input_paths`, this
+    conftest and the plotly-resampler source and compiled extension files.
+    """
+    cache = getattr(config, "cache", None)
+    if cache is None:  # the cacheprovider plugin is disabled (-p no:cacheprovider)
+        return build_fig()
+
+    src_paths = [
+        p
+        for ext in ("py", "so", "pyd")
+        for p in glob.glob(os.path.join(_pr_src_dir, "**", f"*.{ext}"), recursive=True)
+    ]
+    newest_input = max(
+        os.path.getmtime(p) for p in [__file__, *src_paths, *input_paths]
+    )
+    versions = "-".join(
+        [
+            "py" + ".".join(map(str, sys.version_info[:3])),
+            f"pr{plotly_resampler.__version__}",
+            f"plotly{plotly.__version__}",
+            f"pandas{pd.__version__}",
+            f"numpy{np.__version__}",
+            f"pyarrow{pyarrow.__version__}",
+        ]
+    )
+    # pytest < 7 only offers the (py.path returning) `makedir`
+    if hasattr(cache, "mkdir"):
+        cache_dir = cache.mkdir("fixture_figures")
+    else:
+        cache_dir = Path(str(cache.makedir("fixture_figures")))
+    fig_path = cache_dir / f"{name}-{versions}.pkl"
+    if fig_path.exists() and fig_path.stat().st_mtime >= newest_input:
+        try:
+            with open(fig_path, "rb") as f:
+                return pickle.load(f)
+        except (pickle.UnpicklingError, EOFError):  # corrupt pickle -> rebuild
+            pass
+
+    fig = build_fig()
+    with open(fig_path, "wb") as f:
+        pickle.dump(fig, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return fig
 
 
 @pytest.fixture
@@ -45,8 +224,8 @@ def pickle_figure():
     _remove_file(FIG_PATH)
 
 
-@pytest.fixture
-def driver():
+@pytest.fixture(scope="session")
+def _session_driver():
     import time
 
     from selenium.webdriver.chrome.options import Options
@@ -62,7 +241,7 @@ def driver():
     if not TESTING_LOCAL:
         if headless:
             options.add_argument("--headless")
-        # options.add_argument("--no=sandbox")
+        # options.add_argument("--no-sandbox")
         driver = webdriver.Chrome(
             ChromeDriverManager(chrome_type=ChromeType.GOOGLE).install(),
             options=options,
@@ -76,48 +255,50 @@ def driver():
             desired_capabilities=d,
         )
         # driver = webdriver.Firefox(executable_path='/home/jonas/git/gIDLaB/plotly-dynamic-resampling/geckodriver')
-    return driver
+    # The browser is shared by all selenium tests and only closed at session end
+    yield driver
+    driver.quit()
+
+
+@pytest.fixture
+def driver(_session_driver):
+    # Reset the shared browser so no page, console log or requests leak between tests
+    _session_driver.get("about:blank")
+    _session_driver.get_log("browser")
+    del _session_driver.requests
+    return _session_driver
 
 
 @pytest.fixture
 def float_series() -> pd.Series:
-    x = np.arange(_nb_samples).astype(np.uint32)
-    y = np.sin(x / 50).astype(np.float32) + np.random.randn(_nb_samples) / 5
-    return pd.Series(index=x, data=y)
+    x, y = _noisy_sine(_nb_samples)
+    return pd.Series(index=x, data=y, copy=True)
 
 
 @pytest.fixture
 def cat_series() -> pd.Series:
-    cats_list = ["a", "a", "a", "a"] * 2000
-    for i in np.random.randint(0, len(cats_list), 3):
-        cats_list[i] = "b"
-    for i in np.random.randint(0, len(cats_list), 3):
-        cats_list[i] = "c"
-    return pd.Series(cats_list * (_nb_samples // len(cats_list) + 1), dtype="category")[
-        :_nb_samples
-    ]
+    # Mostly a's, with a few sparse b's and c's (encoded as category codes 1 and 2)
+    codes = np.zeros(8_000, dtype=np.int8)
+    codes[np.random.randint(0, len(codes), 3)] = 1
+    codes[np.random.randint(0, len(codes), 3)] = 2
+    return pd.Series(
+        pd.Categorical.from_codes(
+            np.resize(codes, _nb_samples), categories=["a", "b", "c"]
+        )
+    )
 
 
 @pytest.fixture
 def bool_series() -> pd.Series:
-    bool_list = [True, False, True, True, True, True] + [True] * 1000
-    return pd.Series(bool_list * (_nb_samples // len(bool_list) + 1), dtype="bool")[
-        :_nb_samples
-    ]
+    bool_arr = np.ones(1_006, dtype=bool)
+    bool_arr[1] = False
+    return pd.Series(np.resize(bool_arr, _nb_samples), dtype="bool")
 
 
-@pytest.fixture
-def example_figure() -> FigureResampler:
-    df_gusb = pd.read_parquet(f"{data_dir}df_gusb.parquet")
-    df_data_pc = pd.read_parquet(f"{data_dir}df_pc_test.parquet")
-
-    n = 110_000  # _000
-    np_series = np.array(
-        (3 + np.sin(np.arange(n) / 200_000) + np.random.randn(n) / 10)
-        * np.arange(n)
-        / 100_000,
-        dtype=np.float32,
-    )
+def _build_example_figure() -> FigureResampler:
+    df_gusb_pool, df_data_pc = _load_example_data()
+
+    np_series = _rising_noisy_sine(110_000)
     x = np.arange(len(np_series))
 
     fig = FigureResampler(
@@ -137,7 +318,6 @@ def example_figure() -> FigureResampler:
     )
 
     # ------------ swimming pool data -----------
-    df_gusb_pool = df_gusb["zwembad"].last("4D").dropna()
     fig.add_trace(
         go.Scattergl(
             x=df_gusb_pool.index,
@@ -147,8 +327,7 @@ def example_figure() -> FigureResampler:
             name="occupancy",
             showlegend=True,
         ),
-        hf_hovertext="mean last hour: "
-        + df_gusb_pool.rolling("1h").mean().astype(int).astype(str),
+        hf_hovertext=_mean_last_hour_hovertext(df_gusb_pool),
         downsampler=EveryNthPoint(interleave_gaps=False),
         row=1,
         col=1,
@@ -165,17 +344,17 @@ def example_figure() -> FigureResampler:
     )
 
     # ------------- Power consumption data -------------
-    df_data_pc = df_data_pc.last("190D")
-    for i, c in enumerate(df_data_pc.columns):
+    df_data_pc = _last(df_data_pc, "190D")
+    for i, (_, s_pc) in enumerate(df_data_pc.items()):
         fig.add_trace(
             go.Scattergl(
                 name=f"room {i+1}",
             ),
             hf_x=df_data_pc.index,
-            hf_y=df_data_pc[c].astype(np.float32),
+            hf_y=s_pc.astype(np.float32, copy=False),
             row=2,
             col=1,
-            downsampler=LTTB(interleave_gaps=True),
+            downsampler=EfficientLTTB(interleave_gaps=True),
         )
 
     fig.update_layout(height=600)
@@ -188,18 +367,21 @@ def example_figure() -> FigureResampler:
     return fig
 
 
+@pytest.fixture(scope="session")
+def example_figure(pytestconfig) -> FigureResampler:
+    return _cached_figure(
+        pytestconfig,
+        "example_figure",
+        _build_example_figure,
+        input_paths=[f"{data_dir}df_gusb.parquet", f"{data_dir}df_pc_test.parquet"],
+    )
+
+
 @pytest.fixture
 def example_figure_fig() -> go.Figure:
-    df_gusb = pd.read_parquet(f"{data_dir}df_gusb.parquet")
-    df_data_pc = pd.read_parquet(f"{data_dir}df_pc_test.parquet")
-
-    n = 110_000  # _000
-    np_series = np.array(
-        (3 + np.sin(np.arange(n) / 200_000) + np.random.randn(n) / 10)
-        * np.arange(n)
-        / 100_000,
-        dtype=np.float32,
-    )
+    df_gusb_pool, df_data_pc = _load_example_data()
+
+    np_series = _rising_noisy_sine(110_000)
     x = np.arange(len(np_series))
 
     # construct a normal figure object instead of a figureResample object
@@ -212,17 +394,15 @@ def example_figure_fig() -> go.Figure:
     )
 
     # ------------ swimming pool data -----------
-    df_gusb_pool = df_gusb["zwembad"].last("4D").dropna()
     fig.add_trace(
         go.Scattergl(
             x=df_gusb_pool.index,
-            y=df_gusb_pool,  # .astype("uint16"),
+            y=df_gusb_pool,
             mode="markers",
             marker_size=5,
             name="occupancy",
             showlegend=True,
-            hovertext="mean last hour: "
-            + df_gusb_pool.rolling("1h").mean().astype(int).astype(str),
+            hovertext=_mean_last_hour_hovertext(df_gusb_pool),
         ),
         # downsampler=EveryNthPoint(interleave_gaps=False),
         row=1,
@@ -238,13 +418,13 @@ def example_figure_fig() -> go.Figure:
     )
 
     # ------------- Power consumption data -------------
-    df_data_pc = df_data_pc.last("190D")
-    for i, c in enumerate(df_data_pc.columns):
+    df_data_pc = _last(df_data_pc, "190D")
+    for i, (_, s_pc) in enumerate(df_data_pc.items()):
         fig.add_trace(
             go.Scattergl(
                 name=f"room {i+1}",
                 x=df_data_pc.index,
-                y=df_data_pc[c].astype(np.float32),
+                y=s_pc.astype(np.float32, copy=False),
             ),
             row=2,
             col=1,
@@ -260,8 +440,7 @@ def example_figure_fig() -> go.Figure:
     return fig
 
 
-@pytest.fixture
-def gsr_figure() -> FigureResampler:
+def _build_gsr_figure() -> FigureResampler:
     def groupby_consecutive(
         df: Union[pd.Series, pd.DataFrame], col_name: str = None
     ) -> pd.DataFrame:
@@ -292,28 +471,21 @@ def gsr_figure() -> FigureResampler:
 
         assert col_name in df.columns
 
-        df_cum = (
-            (df[col_name].diff(1) != 0)
-            .astype("int")
-            .cumsum()
-            .rename("value_grp")
-            .to_frame()
-        )
-        df_cum["sequence_idx"] = df.index
-        df_cum[col_name] = df[col_name]
+        values = df[col_name].to_numpy()
+        starts, ends = _run_length_bounds(values)
 
         df_grouped = pd.DataFrame(
             {
-                "start": df_cum.groupby("value_grp")["sequence_idx"].first(),
-                "end": df_cum.groupby("value_grp")["sequence_idx"].last(),
-                "n_consecutive": df_cum.groupby("value_grp").size(),
-                col_name: df_cum.groupby("value_grp")[col_name].first(),
+                "start": df.index[starts],
+                "end": df.index[ends],
+                "n_consecutive": ends - starts + 1,
+                col_name: values[starts],
             }
-        ).reset_index(drop=True)
+        )
         df_grouped["next_start"] = df_grouped.start.shift(-1).fillna(df_grouped["end"])
         return df_grouped
 
-    df_gsr = pd.read_parquet(f"{data_dir}processed_gsr.parquet")
+    df_gsr = _load_parquet("processed_gsr.parquet")
 
     fig = FigureResampler(
         make_subplots(
@@ -337,7 +509,8 @@ def gsr_figure() -> FigureResampler:
             go.Scattergl(name=c), hf_x=df_gsr.index, hf_y=df_gsr[c], row=1, col=1
         )
 
-    df_peaks = df_gsr[df_gsr["SCR_Peaks_neurokit_reduced_acc"] == 1]
+    peak_mask = df_gsr["SCR_Peaks_neurokit_reduced_acc"].to_numpy() == 1
+    df_peaks = df_gsr.loc[peak_mask, ["EDA_lf_cleaned"]]
     fig.add_trace(
         trace=go.Scattergl(
             x=df_peaks.index,
@@ -353,31 +526,33 @@ def gsr_figure() -> FigureResampler:
     )
 
     df_grouped = groupby_consecutive(df_gsr["EDA_SQI"])
-    df_grouped["EDA_SQI"] = df_grouped["EDA_SQI"].map(bool)
-    df_grouped["good_sqi"] = df_grouped["EDA_SQI"].map(int)
-    df_grouped["bad_sqi"] = (~df_grouped["EDA_SQI"]).map(int)
-    for sqi_col, col_or in [
-        ("good_sqi", "#2ca02c"),
-        ("bad_sqi", "#d62728"),
-    ]:
-        fig.add_trace(
-            go.Scattergl(
-                x=df_grouped["start"],
-                y=df_grouped[sqi_col],
-                mode="lines",
-                line_width=0,
-                fill="tozeroy",
-                fillcolor=col_or,
-                opacity=0.1 if "good" in sqi_col else 0.2,
-                line_shape="hv",
-                name=sqi_col,
-                showlegend=False,
-            ),
-            max_n_samples=len(df_grouped) + 1,
-            downsampler=EveryNthPoint(interleave_gaps=False),
-            limit_to_view=True,
-            secondary_y=True,
+    sqi = df_grouped["EDA_SQI"].astype(bool).to_numpy()
+    df_grouped["EDA_SQI"] = sqi
+    df_grouped["good_sqi"] = sqi.astype(np.int8)
+    df_grouped["bad_sqi"] = (~sqi).astype(np.int8)
+    # The SQI traces hold little data; add them in a single batched call
+    sqi_traces = [
+        go.Scattergl(
+            x=df_grouped["start"],
+            y=df_grouped[sqi_col],
+            mode="lines",
+            line_width=0,
+            fill="tozeroy",
+            fillcolor=col_or,
+            opacity=0.1 if "good" in sqi_col else 0.2,
+            line_shape="hv",
+            name=sqi_col,
+            showlegend=False,
         )
+        for sqi_col, col_or in [("good_sqi", "#2ca02c"), ("bad_sqi", "#d62728")]
+    ]
+    fig.add_traces(
+        sqi_traces,
+        max_n_samples=len(df_grouped) + 1,
+        downsamplers=[EveryNthPoint(interleave_gaps=False) for _ in sqi_traces],
+        limit_to_views=True,
+        secondary_ys=[True] * len(sqi_traces),
+    )
 
     fig.add_trace(
         go.Scattergl(name="EDA_Phasic", visible="legendonly"),
@@ -390,6 +565,16 @@ def gsr_figure() -> FigureResampler:
     return fig
 
 
+@pytest.fixture(scope="session")
+def gsr_figure(pytestconfig) -> FigureResampler:
+    return _cached_figure(
+        pytestconfig,
+        "gsr_figure",
+        _build_gsr_figure,
+        input_paths=[f"{data_dir}processed_gsr.parquet"],
+    )
+
+
 @pytest.fixture
 def multiple_tz_figure() -> FigureResampler:
     n = 5_050
@@ -277,7 +277,3 @@ class FigureResamplerGUITests:
                     .perform()
                 )
                 return
-
-    # ------------------------------ DATA MODEL METHODS  ------------------------------
-    def __del__(self):
-        self.driver.close()